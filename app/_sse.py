@@ -0,0 +1,69 @@
+"""Byte-level SSE frame parsing shared by the CLI client and tests."""
+
+from __future__ import annotations
+
+_EVENT_PREFIX = b"event:"
+_DATA_PREFIX = b"data:"
+_EVT_LEN = len(_EVENT_PREFIX)
+_DAT_LEN = len(_DATA_PREFIX)
+
+# A frame ends at the first blank line; servers may terminate lines with
+# bare LF or CRLF (and --url makes arbitrary servers reachable), so all
+# blank-line spellings count.
+_TERMINATORS = (b"\n\n", b"\r\n\r\n", b"\n\r\n")
+
+
+class SSEByteParser:
+    """Incremental SSE parser over raw byte chunks.
+
+    Keeps a single bytearray and resumes the terminator scan from a saved
+    offset, so total work stays O(total bytes) instead of re-scanning the
+    in-progress frame on every chunk.
+    """
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+        self._scan_from = 0
+
+    def feed(self, chunk: bytes) -> list[tuple[str, bytes]]:
+        """Append a chunk and return completed (event, data_bytes) frames."""
+        self._buf.extend(chunk)
+        frames: list[tuple[str, bytes]] = []
+        while True:
+            # Take whichever terminator appears first; the earliest match is
+            # unambiguous since no two spellings can start at the same byte.
+            end = -1
+            sep_len = 0
+            for term in _TERMINATORS:
+                pos = self._buf.find(term, self._scan_from)
+                if pos != -1 and (end == -1 or pos < end):
+                    end, sep_len = pos, len(term)
+            if end == -1:
+                # A terminator may straddle the next chunk boundary; keep the
+                # last three bytes in scan range (the longest spelling is four
+                # bytes and can arrive split after its first byte).
+                self._scan_from = max(0, len(self._buf) - 3)
+                break
+            frame = bytes(self._buf[:end])
+            del self._buf[: end + sep_len]
+            self._scan_from = 0
+
+            event = "message"
+            data: bytes | None = None
+            for line in frame.split(b"\n"):
+                if line.endswith(b"\r"):
+                    line = line[:-1]
+                # Short-bytes equality is a single memcmp and skips the
+                # per-iteration len() recomputation.
+                if line[:_EVT_LEN] == _EVENT_PREFIX:
+                    event = line[_EVT_LEN:].strip().decode()
+                elif line[:_DAT_LEN] == _DATA_PREFIX:
+                    # Per the SSE spec at most one leading space follows the
+                    # colon; slicing it off avoids a strip() copy per frame,
+                    # and JSON consumers tolerate whitespace regardless.
+                    data = line[_DAT_LEN:]
+                    if data[:1] == b" ":
+                        data = data[1:]
+            if data is not None:
+                frames.append((event, data))
+        return frames
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 import os
 
 
+_TRUTHY = frozenset({"1", "true", "yes"})
+
+
 def _get_env(name: str, default: str | None = None) -> str | None:
     value = os.getenv(name)
     return value if value is not None else default
@@ -29,15 +33,17 @@ class Settings:
     max_reasoning_chars: int
     upstream_max_retries: int
     upstream_retry_backoff: float
-    allow_models: set[str] | None
+    allow_models: frozenset[str] | None
     summary_model_default: str | None
     enable_parse_reasoning: bool
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
+    """Build Settings from the environment once per process (cached)."""
     allow_models_raw = _get_env("ALLOW_MODELS")
     allow_models = (
-        {m.strip() for m in allow_models_raw.split(",") if m.strip()}
+        frozenset(m.strip() for m in allow_models_raw.split(",") if m.strip())
         if allow_models_raw
         else None
     )
@@ -56,5 +62,5 @@ def get_settings() -> Settings:
         allow_models=allow_models,
         summary_model_default=summary_model_default,
         enable_parse_reasoning=_get_env("ENABLE_PARSE_REASONING", "true").lower()
-        in {"1", "true", "yes"},
+        in _TRUTHY,
     )
@@ -5,13 +5,22 @@ import re
 import uuid
 from typing import Any, AsyncGenerator
 
-from fastapi import FastAPI, HTTPException
+import anyio
+from anyio.streams.memory import MemoryObjectSendStream
+from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 
 from .config import Settings, get_settings
 from .models import GatewayRequest, Message
 from .parsing import TagParser
-from .sse import format_sse
+from .sse import (
+    make_delta_formatter,
+    sse_error,
+    sse_output_done,
+    sse_summary_prompt,
+    sse_summary_reasoning,
+)
 from .upstream import UpstreamClient
 
 
@@ -19,28 +28,38 @@ def _build_prompt_text(messages: list[Message]) -> str:
     return "\n".join(f"{m.role}: {m.content}" for m in messages)
 
 
+# Summary instructions are constant; build the system messages and user
+# prefixes once instead of per request. The system dicts are shared and
+# never mutated — httpx only serializes them.
+_PROMPT_SYS_MSG = {
+    "role": "system",
+    "content": "You are a concise assistant that summarizes user prompts.",
+}
+_PROMPT_USER_PREFIX = (
+    "Summarize the following prompt in 1-2 sentences. "
+    "Keep it faithful and brief.\n\nPrompt:\n"
+)
+_REASONING_SYS_MSG = {
+    "role": "system",
+    "content": "You are a concise assistant that summarizes reasoning.",
+}
+_REASONING_USER_PREFIX = (
+    "Summarize the following reasoning in 2-3 bullet points. "
+    "Focus on the key steps only.\n\nReasoning:\n"
+)
+
+
 def _build_summary_payload(text: str, model: str, kind: str) -> dict[str, Any]:
     if kind == "prompt":
-        system = "You are a concise assistant that summarizes user prompts."
-        user = (
-            "Summarize the following prompt in 1-2 sentences. "
-            "Keep it faithful and brief.\n\n"
-            f"Prompt:\n{text}"
-        )
+        system_msg = _PROMPT_SYS_MSG
+        user = _PROMPT_USER_PREFIX + text
     else:
-        system = "You are a concise assistant that summarizes reasoning."
-        user = (
-            "Summarize the following reasoning in 2-3 bullet points. "
-            "Focus on the key steps only.\n\n"
-            f"Reasoning:\n{text}"
-        )
+        system_msg = _REASONING_SYS_MSG
+        user = _REASONING_USER_PREFIX + text
 
     return {
         "model": model,
-        "messages": [
-            {"role": "system", "content": system},
-            {"role": "user", "content": user},
-        ],
+        "messages": [system_msg, {"role": "user", "content": user}],
         "stream": False,
     }
 
@@ -71,20 +90,35 @@ def _strip_tags(text: str) -> str:
     )
 
 
-def _inject_tag_instruction(messages: list[Message]) -> list[dict[str, str]]:
-    instruction = (
+# Shared like the summary system messages above: serialized per request but
+# never mutated.
+_TAG_SYS_MSG = {
+    "role": "system",
+    "content": (
         "Respond with reasoning inside <analysis>...</analysis> and the final answer "
         "inside <final>...</final>. Output only those tags and their content."
-    )
-    tagged_messages = [{"role": "system", "content": instruction}]
-    tagged_messages.extend({"role": m.role, "content": m.content} for m in messages)
-    return tagged_messages
+    ),
+}
 
 
-def _build_main_payload(req: GatewayRequest) -> dict[str, Any]:
-    payload = req.model_dump(by_alias=True, exclude_none=True)
-    payload["messages"] = _inject_tag_instruction(req.messages)
-    payload["stream"] = True
+def _inject_tag_instruction(raw_messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return [_TAG_SYS_MSG, *raw_messages]
+
+
+# Request fields consumed by the gateway itself; never forwarded upstream.
+_GATEWAY_ONLY_FIELDS = ("summary_model", "emit_summaries")
+
+
+def _build_main_payload(raw: dict[str, Any]) -> dict[str, Any]:
+    # Reuse the dict FastAPI already parsed from the request body instead of
+    # re-exporting the validated model field by field.
+    payload = {
+        **raw,
+        "messages": _inject_tag_instruction(raw["messages"]),
+        "stream": True,
+    }
+    for field in _GATEWAY_ONLY_FIELDS:
+        payload.pop(field, None)
     return payload
 
 
@@ -92,69 +126,87 @@ async def _consume_stream(
     payload: dict[str, Any],
     upstream: UpstreamClient,
     settings: Settings,
-    final_queue: asyncio.Queue[str | None],
+    final_send: MemoryObjectSendStream[str],
     reasoning_buffer: list[str],
-    analysis_done: asyncio.Event,
-    stream_done: asyncio.Event,
+    analysis_or_done: asyncio.Event,
     stream_errors: list[str],
 ) -> None:
     parser = TagParser()
     raw_chunks: list[str] = []
     used_reasoning_field = False
-
+    reasoning_len = 0
+    reasoning_cap = settings.max_reasoning_chars
+
+    def _buffer_reasoning(text: str) -> None:
+        # Only max_reasoning_chars are ever summarized; stop buffering at the
+        # cap and unblock the reasoning summary as soon as it is reached.
+        nonlocal reasoning_len
+        if reasoning_len >= reasoning_cap:
+            return
+        piece = text[: reasoning_cap - reasoning_len]
+        reasoning_buffer.append(piece)
+        reasoning_len += len(piece)
+        if reasoning_len >= reasoning_cap and not analysis_or_done.is_set():
+            analysis_or_done.set()
+
+    # The send stream is bounded, so analysis_or_done must be set *before* any
+    # send loop that could block — the consumer waits on it before draining.
     try:
         async for reasoning_text, content_text in upstream.stream_deltas(payload):
             if reasoning_text and settings.enable_parse_reasoning:
                 used_reasoning_field = True
-                reasoning_buffer.append(reasoning_text)
+                _buffer_reasoning(reasoning_text)
                 raw_chunks.append(reasoning_text)
 
             if content_text:
                 raw_chunks.append(content_text)
                 if used_reasoning_field and settings.enable_parse_reasoning:
-                    if not analysis_done.is_set():
-                        analysis_done.set()
-                    await final_queue.put(_strip_tags(content_text))
+                    if not analysis_or_done.is_set():
+                        analysis_or_done.set()
+                    await final_send.send(_strip_tags(content_text))
                 else:
                     parsed = parser.feed(content_text)
-                    if parsed.analysis_chunks:
-                        reasoning_buffer.extend(parsed.analysis_chunks)
-                    if parsed.analysis_done and not analysis_done.is_set():
-                        analysis_done.set()
+                    for chunk in parsed.analysis_chunks:
+                        _buffer_reasoning(chunk)
+                    if parsed.analysis_done or parsed.final_chunks:
+                        if not analysis_or_done.is_set():
+                            analysis_or_done.set()
                     for chunk in parsed.final_chunks:
-                        await final_queue.put(chunk)
-                    if parsed.final_chunks and not analysis_done.is_set():
-                        analysis_done.set()
+                        await final_send.send(chunk)
 
-        if not analysis_done.is_set() and reasoning_buffer:
-            analysis_done.set()
+        if not analysis_or_done.is_set() and reasoning_buffer:
+            analysis_or_done.set()
 
         if not used_reasoning_field:
             parsed = parser.finalize()
-            if parsed.analysis_chunks:
-                reasoning_buffer.extend(parsed.analysis_chunks)
-                if not analysis_done.is_set():
-                    analysis_done.set()
+            for chunk in parsed.analysis_chunks:
+                _buffer_reasoning(chunk)
+            if parsed.analysis_chunks or parsed.final_chunks:
+                if not analysis_or_done.is_set():
+                    analysis_or_done.set()
             for chunk in parsed.final_chunks:
-                await final_queue.put(chunk)
+                await final_send.send(chunk)
 
             if not parser.seen_any_tag and raw_chunks:
+                if not analysis_or_done.is_set():
+                    analysis_or_done.set()
                 for chunk in raw_chunks:
                     if chunk:
-                        await final_queue.put(chunk)
-                if not analysis_done.is_set():
-                    analysis_done.set()
+                        await final_send.send(chunk)
     except Exception as exc:  # pragma: no cover - safety
         stream_errors.append(str(exc))
     finally:
-        await final_queue.put(None)
-        stream_done.set()
+        await final_send.aclose()
+        # Stream over (or failed): unblock the consumer either way.
+        analysis_or_done.set()
 
 
 def create_app(upstream_client: UpstreamClient | None = None) -> FastAPI:
     settings = get_settings()
     upstream = upstream_client or UpstreamClient.from_settings(settings)
     app = FastAPI()
+    if hasattr(upstream, "aclose"):
+        app.add_event_handler("shutdown", upstream.aclose)
 
     @app.get("/healthz")
     async def healthz():
@@ -166,25 +218,42 @@ def create_app(upstream_client: UpstreamClient | None = None) -> FastAPI:
         return {"status": "ok" if ok else "degraded", "upstream": ok}
 
     @app.post("/v1/chat/completions")
-    async def chat_completions(req: GatewayRequest):
+    async def chat_completions(
+        request: Request, settings: Settings = Depends(get_settings)
+    ):
+        try:
+            raw = await request.json()
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid JSON body")
+        try:
+            req = GatewayRequest.model_validate(raw)
+        except ValidationError as exc:
+            raise HTTPException(status_code=422, detail=exc.errors(include_url=False))
+
         if settings.allow_models is not None and req.model not in settings.allow_models:
             raise HTTPException(status_code=400, detail="Model not allowed")
         if not req.stream:
             raise HTTPException(status_code=400, detail="stream=true is required")
 
         request_id = uuid.uuid4().hex
-        prompt_text = _build_prompt_text(req.messages)
-        summary_model = req.summary_model or settings.summary_model_default or req.model
-
-        prompt_summary_payload = _build_summary_payload(
-            prompt_text, summary_model, kind="prompt"
-        )
-        main_payload = _build_main_payload(req)
+        format_delta = make_delta_formatter(request_id)
+        main_payload = _build_main_payload(raw)
+
+        # Summaries double or triple upstream cost, so they are opt-in.
+        if req.emit_summaries:
+            prompt_text = _build_prompt_text(req.messages)
+            summary_model = (
+                req.summary_model or settings.summary_model_default or req.model
+            )
+            prompt_summary_payload = _build_summary_payload(
+                prompt_text, summary_model, kind="prompt"
+            )
 
-        async def event_stream() -> AsyncGenerator[str, None]:
-            final_queue: asyncio.Queue[str | None] = asyncio.Queue()
-            analysis_done = asyncio.Event()
-            stream_done = asyncio.Event()
+        async def event_stream() -> AsyncGenerator[bytes, None]:
+            final_send, final_recv = anyio.create_memory_object_stream[str](
+                max_buffer_size=64
+            )
+            analysis_or_done = asyncio.Event()
             reasoning_buffer: list[str] = []
             stream_errors: list[str] = []
 
@@ -193,101 +262,98 @@ def create_app(upstream_client: UpstreamClient | None = None) -> FastAPI:
                     main_payload,
                     upstream,
                     settings,
-                    final_queue,
+                    final_send,
                     reasoning_buffer,
-                    analysis_done,
-                    stream_done,
+                    analysis_or_done,
                     stream_errors,
                 )
             )
 
-            prompt_summary_task = asyncio.create_task(
-                upstream.complete(prompt_summary_payload)
+            prompt_summary_task = (
+                asyncio.create_task(upstream.complete(prompt_summary_payload))
+                if req.emit_summaries
+                else None
             )
 
             try:
-                try:
-                    prompt_summary = await asyncio.wait_for(
-                        prompt_summary_task, timeout=settings.summary_timeout
-                    )
-                    yield format_sse(
-                        "summary.prompt",
-                        {"text": prompt_summary, "request_id": request_id},
-                    )
-                except Exception as exc:
-                    yield format_sse(
-                        "error",
-                        {
-                            "message": "prompt summary failed",
-                            "stage": "prompt_summary",
-                            "request_id": request_id,
-                            "detail": _error_detail(exc),
-                        },
-                    )
-                    fallback_summary = _fallback_summary(prompt_text)
-                    yield format_sse(
-                        "summary.prompt",
-                        {"text": fallback_summary, "request_id": request_id},
-                    )
-
-                wait_tasks = {
-                    asyncio.create_task(analysis_done.wait()),
-                    asyncio.create_task(stream_done.wait()),
-                }
-                done, pending = await asyncio.wait(
-                    wait_tasks, return_when=asyncio.FIRST_COMPLETED
-                )
-                for task in pending:
-                    task.cancel()
-
-                reasoning_text = "".join(reasoning_buffer)
-                if reasoning_text:
-                    reasoning_text = reasoning_text[: settings.max_reasoning_chars]
-                    reasoning_payload = _build_summary_payload(
-                        reasoning_text, summary_model, kind="reasoning"
-                    )
+                if prompt_summary_task is not None:
                     try:
-                        reasoning_summary = await asyncio.wait_for(
-                            upstream.complete(reasoning_payload),
-                            timeout=settings.summary_timeout,
+                        prompt_summary = await asyncio.wait_for(
+                            prompt_summary_task, timeout=settings.summary_timeout
                         )
-                        yield format_sse(
-                            "summary.reasoning",
-                            {"text": reasoning_summary, "request_id": request_id},
+                        yield sse_summary_prompt(
+                            {"text": prompt_summary, "request_id": request_id},
                         )
                     except Exception as exc:
-                        yield format_sse(
-                            "error",
+                        yield sse_error(
                             {
-                                "message": "reasoning summary failed",
-                                "stage": "reasoning_summary",
+                                "message": "prompt summary failed",
+                                "stage": "prompt_summary",
                                 "request_id": request_id,
                                 "detail": _error_detail(exc),
                             },
                         )
-                        fallback_summary = _fallback_summary(reasoning_text)
-                        yield format_sse(
-                            "summary.reasoning",
+                        fallback_summary = _fallback_summary(prompt_text)
+                        yield sse_summary_prompt(
                             {"text": fallback_summary, "request_id": request_id},
                         )
-                else:
-                    yield format_sse(
-                        "summary.reasoning",
-                        {"text": "", "request_id": request_id},
-                    )
 
-                while True:
-                    chunk = await final_queue.get()
-                    if chunk is None:
+                    await analysis_or_done.wait()
+
+                    # _consume_stream caps the buffer at max_reasoning_chars,
+                    # so the join is already bounded.
+                    reasoning_text = "".join(reasoning_buffer)
+                    if reasoning_text:
+                        reasoning_payload = _build_summary_payload(
+                            reasoning_text, summary_model, kind="reasoning"
+                        )
+                        try:
+                            reasoning_summary = await asyncio.wait_for(
+                                upstream.complete(reasoning_payload),
+                                timeout=settings.summary_timeout,
+                            )
+                            yield sse_summary_reasoning(
+                                {"text": reasoning_summary, "request_id": request_id},
+                            )
+                        except Exception as exc:
+                            yield sse_error(
+                                {
+                                    "message": "reasoning summary failed",
+                                    "stage": "reasoning_summary",
+                                    "request_id": request_id,
+                                    "detail": _error_detail(exc),
+                                },
+                            )
+                            fallback_summary = _fallback_summary(reasoning_text)
+                            yield sse_summary_reasoning(
+                                {"text": fallback_summary, "request_id": request_id},
+                            )
+                    else:
+                        yield sse_summary_reasoning(
+                            {"text": "", "request_id": request_id},
+                        )
+
+                # Coalesce whatever the producer has already buffered into one
+                # SSE frame; sub-token deltas otherwise cost ~120 bytes of
+                # framing and one socket write each.
+                closed = False
+                while not closed:
+                    try:
+                        parts = [await final_recv.receive()]
+                    except anyio.EndOfStream:
                         break
-                    yield format_sse(
-                        "output.delta",
-                        {"text": chunk, "request_id": request_id},
-                    )
+                    while True:
+                        try:
+                            parts.append(final_recv.receive_nowait())
+                        except anyio.WouldBlock:
+                            break
+                        except anyio.EndOfStream:
+                            closed = True
+                            break
+                    yield format_delta("".join(parts))
 
                 if stream_errors:
-                    yield format_sse(
-                        "error",
+                    yield sse_error(
                         {
                             "message": stream_errors[0],
                             "stage": "upstream_stream",
@@ -295,15 +361,17 @@ def create_app(upstream_client: UpstreamClient | None = None) -> FastAPI:
                         },
                     )
 
-                yield format_sse("output.done", {"request_id": request_id})
+                yield sse_output_done({"request_id": request_id})
             except asyncio.CancelledError:
                 stream_task.cancel()
-                prompt_summary_task.cancel()
+                if prompt_summary_task is not None:
+                    prompt_summary_task.cancel()
                 raise
             finally:
+                final_recv.close()
                 if not stream_task.done():
                     stream_task.cancel()
-                if not prompt_summary_task.done():
+                if prompt_summary_task is not None and not prompt_summary_task.done():
                     prompt_summary_task.cancel()
                 try:
                     await stream_task
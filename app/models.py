@@ -15,6 +15,7 @@ class GatewayRequest(BaseModel):
     messages: list[Message]
     stream: bool = True
     summary_model: str | None = None
+    emit_summaries: bool = False
     temperature: float | None = None
     max_tokens: int | None = Field(default=None, alias="max_tokens")
     top_p: float | None = None
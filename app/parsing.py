@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 
 
@@ -8,6 +9,14 @@ CLOSE_ANALYSIS = "</analysis>"
 OPEN_FINAL = "<final>"
 CLOSE_FINAL = "</final>"
 
+# Compact the carry buffer once this much consumed text has accumulated.
+_COMPACT_THRESHOLD = 4096
+
+# One C-level scan finds whichever tag comes first instead of one
+# str.find pass per tag.
+_TAG_RE = re.compile(r"</?(?:analysis|final)>")
+_OPEN_STATES = {OPEN_ANALYSIS: "analysis", OPEN_FINAL: "final"}
+
 
 @dataclass
 class ParseResult:
@@ -23,9 +32,27 @@ class TagParser:
     def __init__(self) -> None:
         self._state = "unknown"
         self._carry = ""
+        self._pos = 0
         self.seen_any_tag = False
         self.seen_final = False
 
+    def _safe_flush_end(self, close_tag_len: int) -> int:
+        """Furthest index that cannot belong to a partial close tag.
+
+        The conservative bound withholds close_tag_len - 1 trailing
+        characters, but anything before the first '<' in that tail is plain
+        content and can be flushed immediately.
+        """
+        safe_end = max(self._pos, len(self._carry) - close_tag_len + 1)
+        lt = self._carry.find("<", safe_end)
+        return lt if lt != -1 else len(self._carry)
+
+    def _compact(self) -> None:
+        """Drop consumed text so the carry buffer doesn't grow without bound."""
+        if self._pos > _COMPACT_THRESHOLD:
+            self._carry = self._carry[self._pos :]
+            self._pos = 0
+
     def feed(self, text: str) -> ParseResult:
         """Consume streamed text and return any completed analysis/final chunks."""
         self._carry += text
@@ -36,44 +63,41 @@ class TagParser:
 
         while True:
             if self._state == "unknown":
-                idx_a = self._carry.find(OPEN_ANALYSIS)
-                idx_f = self._carry.find(OPEN_FINAL)
-                if idx_a == -1 and idx_f == -1:
+                match = _TAG_RE.search(self._carry, self._pos)
+                while match is not None and match.group() not in _OPEN_STATES:
+                    # Stray close tags outside a section are skipped, as before.
+                    match = _TAG_RE.search(self._carry, match.end())
+                if match is None:
                     break
-                if idx_a != -1 and (idx_f == -1 or idx_a < idx_f):
-                    self.seen_any_tag = True
-                    self._carry = self._carry[idx_a + len(OPEN_ANALYSIS) :]
-                    self._state = "analysis"
-                    continue
                 self.seen_any_tag = True
-                self._carry = self._carry[idx_f + len(OPEN_FINAL) :]
-                self._state = "final"
+                self._pos = match.end()
+                self._state = _OPEN_STATES[match.group()]
                 continue
 
             if self._state == "analysis":
-                idx = self._carry.find(CLOSE_ANALYSIS)
+                idx = self._carry.find(CLOSE_ANALYSIS, self._pos)
                 if idx == -1:
-                    safe_len = max(0, len(self._carry) - len(CLOSE_ANALYSIS) + 1)
-                    if safe_len:
-                        analysis_chunks.append(self._carry[:safe_len])
-                        self._carry = self._carry[safe_len:]
+                    safe_end = self._safe_flush_end(len(CLOSE_ANALYSIS))
+                    if safe_end > self._pos:
+                        analysis_chunks.append(self._carry[self._pos : safe_end])
+                        self._pos = safe_end
                     break
-                analysis_chunks.append(self._carry[:idx])
-                self._carry = self._carry[idx + len(CLOSE_ANALYSIS) :]
+                analysis_chunks.append(self._carry[self._pos : idx])
+                self._pos = idx + len(CLOSE_ANALYSIS)
                 self._state = "unknown"
                 analysis_done = True
                 continue
 
             if self._state == "final":
-                idx = self._carry.find(CLOSE_FINAL)
+                idx = self._carry.find(CLOSE_FINAL, self._pos)
                 if idx == -1:
-                    safe_len = max(0, len(self._carry) - len(CLOSE_FINAL) + 1)
-                    if safe_len:
-                        final_chunks.append(self._carry[:safe_len])
-                        self._carry = self._carry[safe_len:]
+                    safe_end = self._safe_flush_end(len(CLOSE_FINAL))
+                    if safe_end > self._pos:
+                        final_chunks.append(self._carry[self._pos : safe_end])
+                        self._pos = safe_end
                     break
-                final_chunks.append(self._carry[:idx])
-                self._carry = self._carry[idx + len(CLOSE_FINAL) :]
+                final_chunks.append(self._carry[self._pos : idx])
+                self._pos = idx + len(CLOSE_FINAL)
                 self._state = "done"
                 self.seen_final = True
                 final_done = True
@@ -81,8 +105,10 @@ class TagParser:
 
             if self._state == "done":
                 self._carry = ""
+                self._pos = 0
                 break
 
+        self._compact()
         return ParseResult(
             analysis_chunks=analysis_chunks,
             final_chunks=final_chunks,
@@ -97,15 +123,16 @@ class TagParser:
         analysis_done = False
         final_done = False
 
-        if self._state == "analysis" and self._carry:
-            analysis_chunks.append(self._carry)
-            self._carry = ""
+        remainder = self._carry[self._pos :]
+        if self._state == "analysis" and remainder:
+            analysis_chunks.append(remainder)
             analysis_done = True
-        elif self._state == "final" and self._carry:
-            final_chunks.append(self._carry)
-            self._carry = ""
+        elif self._state == "final" and remainder:
+            final_chunks.append(remainder)
         elif self._state == "done":
             final_done = True
+        self._carry = ""
+        self._pos = 0
 
         return ParseResult(
             analysis_chunks=analysis_chunks,
@@ -1,9 +1,55 @@
 from __future__ import annotations
 
-import json
-from typing import Any
+from typing import Any, Callable
 
+import orjson
 
-def format_sse(event: str, data: dict[str, Any]) -> str:
-    payload = json.dumps(data, ensure_ascii=False)
-    return f"event: {event}\ndata: {payload}\n\n"
+
+# Event names the gateway emits are known statically; bake their framing
+# prefixes at import so emitting an event is dump-and-concat only.
+_KNOWN_EVENTS = (
+    "summary.prompt",
+    "summary.reasoning",
+    "error",
+    "output.delta",
+    "output.done",
+)
+_SSE_PREFIXES = {event: f"event: {event}\ndata: ".encode() for event in _KNOWN_EVENTS}
+
+
+def format_sse(event: str, data: dict[str, Any]) -> bytes:
+    prefix = _SSE_PREFIXES.get(event)
+    if prefix is None:
+        prefix = b"event: " + event.encode() + b"\ndata: "
+    return prefix + orjson.dumps(data) + b"\n\n"
+
+
+def _specialize(event: str) -> Callable[[dict[str, Any]], bytes]:
+    prefix = _SSE_PREFIXES[event]
+
+    def emit(data: dict[str, Any]) -> bytes:
+        return prefix + orjson.dumps(data) + b"\n\n"
+
+    return emit
+
+
+sse_summary_prompt = _specialize("summary.prompt")
+sse_summary_reasoning = _specialize("summary.reasoning")
+sse_error = _specialize("error")
+sse_output_done = _specialize("output.done")
+
+
+def make_delta_formatter(request_id: str) -> Callable[[str], bytes]:
+    """Build an output.delta serializer with the request_id baked in.
+
+    Deltas are emitted hundreds of times per stream; baking the constant
+    framing and request_id into prefix/suffix bytes leaves only the text
+    itself to JSON-encode per event.
+    """
+    prefix = b'event: output.delta\ndata: {"text":'
+    suffix = b',"request_id":"' + request_id.encode() + b'"}\n\n'
+
+    def format_delta(text: str) -> bytes:
+        return prefix + orjson.dumps(text) + suffix
+
+    return format_delta
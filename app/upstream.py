@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import random
+import time
 from typing import Any, AsyncGenerator
 
 import httpx
+import orjson
 
 from .config import Settings
 
@@ -13,40 +15,73 @@ class UpstreamError(RuntimeError):
     pass
 
 
+_RETRY_SLEEP_CAP = 10.0
+
+# Per-process generator; keeps retry jitter off the random module's shared
+# global state.
+_jitter = random.Random()
+
+
+def _next_retry_sleep(prev_sleep: float, base: float) -> float:
+    """Decorrelated jitter so synchronized clients don't retry in lockstep."""
+    return min(_RETRY_SLEEP_CAP, _jitter.uniform(base, prev_sleep * 3))
+
+
 class UpstreamClient:
     """HTTP client wrapper for the upstream /chat/completions API."""
 
     def __init__(self, settings: Settings) -> None:
         self._settings = settings
+        self._client: httpx.AsyncClient | None = None
+        # Settings are frozen, so the default headers never change; build
+        # them once and install them on the shared client.
+        self._default_headers = {"Content-Type": "application/json"}
+        if settings.upstream_api_key:
+            self._default_headers["Authorization"] = (
+                f"Bearer {settings.upstream_api_key}"
+            )
 
     @classmethod
     def from_settings(cls, settings: Settings) -> "UpstreamClient":
         return cls(settings)
 
-    def _headers(self) -> dict[str, str]:
-        headers = {"Content-Type": "application/json"}
-        if self._settings.upstream_api_key:
-            headers["Authorization"] = f"Bearer {self._settings.upstream_api_key}"
-        return headers
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared connection-pooled client, creating it lazily."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self._settings.upstream_base_url,
+                timeout=self._settings.request_timeout,
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+                headers=self._default_headers,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared client (registered as a FastAPI shutdown hook)."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     def _should_retry(self, status_code: int | None) -> bool:
         return status_code in {502, 503, 504}
 
     async def complete(self, payload: dict[str, Any]) -> str:
         """Send a non-streaming completion request and return content text."""
-        url = f"{self._settings.upstream_base_url}{self._settings.upstream_path}"
+        client = self._get_client()
         retries = self._settings.upstream_max_retries
         backoff = self._settings.upstream_retry_backoff
+        deadline = time.monotonic() + self._settings.request_timeout
+        sleep = backoff
         for attempt in range(retries + 1):
             try:
-                async with httpx.AsyncClient(
-                    timeout=self._settings.request_timeout
-                ) as client:
-                    resp = await client.post(url, headers=self._headers(), json=payload)
+                resp = await client.post(self._settings.upstream_path, json=payload)
                 if resp.status_code >= 400:
                     if self._should_retry(resp.status_code) and attempt < retries:
-                        await asyncio.sleep(backoff * (2**attempt))
-                        continue
+                        sleep = _next_retry_sleep(sleep, backoff)
+                        if time.monotonic() + sleep < deadline:
+                            await asyncio.sleep(sleep)
+                            continue
                     raise UpstreamError(
                         f"Upstream error {resp.status_code}: {resp.text}"
                     )
@@ -54,8 +89,10 @@ class UpstreamClient:
                 break
             except httpx.RequestError as exc:
                 if attempt < retries:
-                    await asyncio.sleep(backoff * (2**attempt))
-                    continue
+                    sleep = _next_retry_sleep(sleep, backoff)
+                    if time.monotonic() + sleep < deadline:
+                        await asyncio.sleep(sleep)
+                        continue
                 raise UpstreamError("Upstream request failed") from exc
 
         try:
@@ -67,62 +104,77 @@ class UpstreamClient:
         self, payload: dict[str, Any]
     ) -> AsyncGenerator[tuple[str | None, str | None], None]:
         """Stream delta chunks and yield (reasoning_text, content_text) pairs."""
-        url = f"{self._settings.upstream_base_url}{self._settings.upstream_path}"
+        client = self._get_client()
         retries = self._settings.upstream_max_retries
         backoff = self._settings.upstream_retry_backoff
+        deadline = time.monotonic() + self._settings.request_timeout
+        sleep = backoff
 
         for attempt in range(retries + 1):
             try:
-                async with httpx.AsyncClient(
-                    timeout=self._settings.request_timeout
-                ) as client:
-                    async with client.stream(
-                        "POST", url, headers=self._headers(), json=payload
-                    ) as resp:
-                        if resp.status_code >= 400:
-                            text = await resp.aread()
-                            if self._should_retry(resp.status_code) and attempt < retries:
-                                await asyncio.sleep(backoff * (2**attempt))
-                                continue
-                            raise UpstreamError(
-                                f"Upstream error {resp.status_code}: {text.decode()}"
-                            )
-
-                        async for line in resp.aiter_lines():
-                            if not line:
+                async with client.stream(
+                    "POST", self._settings.upstream_path, json=payload
+                ) as resp:
+                    if resp.status_code >= 400:
+                        text = await resp.aread()
+                        if self._should_retry(resp.status_code) and attempt < retries:
+                            sleep = _next_retry_sleep(sleep, backoff)
+                            if time.monotonic() + sleep < deadline:
+                                await asyncio.sleep(sleep)
                                 continue
-                            if not line.startswith("data:"):
+                        raise UpstreamError(
+                            f"Upstream error {resp.status_code}: {text.decode()}"
+                        )
+
+                    # Frame SSE lines from raw bytes; aiter_lines would decode
+                    # and split every chunk into str before we re-encode it.
+                    buf = bytearray()
+                    async for raw in resp.aiter_bytes():
+                        buf.extend(raw)
+                        while (nl := buf.find(b"\n")) != -1:
+                            line = bytes(buf[:nl])
+                            del buf[: nl + 1]
+                            if line.endswith(b"\r"):
+                                line = line[:-1]
+                            # SSE emits exactly "data: <payload>"; slice at a
+                            # fixed offset instead of allocating a stripped
+                            # copy, with a lenient path for a missing space.
+                            if line[:6] == b"data: ":
+                                data = line[6:]
+                            elif line[:5] == b"data:":
+                                data = line[5:].lstrip()
+                            else:
                                 continue
-                            data = line[len("data:") :].strip()
-                            if data == "[DONE]":
+                            if data == b"[DONE]":
                                 return
                             try:
-                                chunk = json.loads(data)
-                            except json.JSONDecodeError:
+                                chunk = orjson.loads(data)
+                            except orjson.JSONDecodeError:
                                 continue
 
                             delta = (
                                 chunk.get("choices", [{}])[0]
                                 .get("delta", {})
                             )
-                            reasoning_text = delta.get("reasoning_content") or delta.get(
-                                "reasoning"
-                            )
+                            reasoning_text = delta.get(
+                                "reasoning_content"
+                            ) or delta.get("reasoning")
                             content_text = delta.get("content")
                             yield reasoning_text, content_text
-                        return
+                    return
             except httpx.RequestError as exc:
                 if attempt < retries:
-                    await asyncio.sleep(backoff * (2**attempt))
-                    continue
+                    sleep = _next_retry_sleep(sleep, backoff)
+                    if time.monotonic() + sleep < deadline:
+                        await asyncio.sleep(sleep)
+                        continue
                 raise UpstreamError("Upstream request failed") from exc
 
     async def ping(self) -> bool:
         """Check upstream reachability with a simple GET."""
-        url = f"{self._settings.upstream_base_url}/"
         try:
-            async with httpx.AsyncClient(timeout=self._settings.summary_timeout) as client:
-                resp = await client.get(url)
+            client = self._get_client()
+            resp = await client.get("/", timeout=self._settings.summary_timeout)
             return resp.status_code < 500
         except Exception:
             return False
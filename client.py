@@ -8,6 +8,9 @@ import time
 from typing import Any
 
 import httpx
+import orjson
+
+from app._sse import SSEByteParser
 
 
 def _parse_args() -> argparse.Namespace:
@@ -23,6 +26,12 @@ def _parse_args() -> argparse.Namespace:
         default="Explain what FriendliAI does and what makes it special.",
         help="User message to send.",
     )
+    parser.add_argument(
+        "--summaries",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Request prompt/reasoning summary events (--no-summaries to skip them).",
+    )
     parser.add_argument(
         "--wake",
         action="store_true",
@@ -53,28 +62,69 @@ def _parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def _handle_event(event: str, data: dict[str, Any]) -> None:
-    if event == "summary.prompt":
-        print("\n=== 1) Summary of the prompt ===\n" + data.get("text", ""))
-    elif event == "summary.reasoning":
-        print("\n=== 2) Summary of the model's reasoning ===\n" + data.get("text", ""))
-    elif event == "output.delta":
-        if not getattr(_handle_event, "_final_started", False):
-            print("\n=== 3) The model's final output ===")
-            _handle_event._final_started = True  # type: ignore[attr-defined]
-        sys.stdout.write(data.get("text", ""))
-        sys.stdout.flush()
-    elif event == "output.done":
-        print("\n\n[done]")
-    elif event == "error":
-        print(f"\n[error] {data}")
-
-
-def _dedicated_status(endpoint_id: str, token: str) -> dict[str, Any] | None:
+# Bound methods and handler dispatch are resolved once at import; the delta
+# handler runs once per streamed token, so it writes raw bytes and flushes
+# every few tokens instead of per write.
+_write = sys.stdout.buffer.write
+_flush = sys.stdout.buffer.flush
+_FLUSH_EVERY = 16
+
+_delta_state = {"started": False, "pending": 0}
+
+
+def _on_summary_prompt(data: dict[str, Any]) -> None:
+    print("\n=== 1) Summary of the prompt ===\n" + data.get("text", ""), flush=True)
+
+
+def _on_summary_reasoning(data: dict[str, Any]) -> None:
+    print(
+        "\n=== 2) Summary of the model's reasoning ===\n" + data.get("text", ""),
+        flush=True,
+    )
+
+
+def _on_output_delta(data: dict[str, Any]) -> None:
+    if not _delta_state["started"]:
+        print("\n=== 3) The model's final output ===", flush=True)
+        _delta_state["started"] = True
+    _write(data.get("text", "").encode())
+    _delta_state["pending"] += 1
+    if _delta_state["pending"] >= _FLUSH_EVERY:
+        _flush()
+        _delta_state["pending"] = 0
+
+
+def _on_output_done(data: dict[str, Any]) -> None:
+    _flush()
+    _delta_state["pending"] = 0
+    print("\n\n[done]")
+
+
+def _on_error(data: dict[str, Any]) -> None:
+    _flush()
+    print(f"\n[error] {data}")
+
+
+def _on_default(data: dict[str, Any]) -> None:
+    pass
+
+
+_DISPATCH = {
+    "summary.prompt": _on_summary_prompt,
+    "summary.reasoning": _on_summary_reasoning,
+    "output.delta": _on_output_delta,
+    "output.done": _on_output_done,
+    "error": _on_error,
+}
+
+
+def _dedicated_status(
+    client: httpx.Client, endpoint_id: str, token: str
+) -> dict[str, Any] | None:
     url = f"https://api.friendli.ai/dedicated/beta/endpoint/{endpoint_id}/status"
     headers = {"Authorization": f"Bearer {token}"}
     try:
-        resp = httpx.get(url, headers=headers, timeout=10.0)
+        resp = client.get(url, headers=headers, timeout=10.0)
         if resp.status_code >= 400:
             print(f"[warn] status check failed: {resp.status_code} {resp.text}")
             return None
@@ -84,26 +134,32 @@ def _dedicated_status(endpoint_id: str, token: str) -> dict[str, Any] | None:
         return None
 
 
-def _dedicated_wake(endpoint_id: str, token: str) -> None:
+def _dedicated_wake(client: httpx.Client, endpoint_id: str, token: str) -> None:
     url = f"https://api.friendli.ai/dedicated/beta/endpoint/{endpoint_id}/wake"
     headers = {"Authorization": f"Bearer {token}"}
     try:
-        resp = httpx.put(url, headers=headers, timeout=10.0)
+        resp = client.put(url, headers=headers, timeout=10.0)
         if resp.status_code >= 400:
             print(f"[warn] wake request failed: {resp.status_code} {resp.text}")
     except Exception as exc:
         print(f"[warn] wake request failed: {exc}")
 
 
+# Hoisted so each status poll reuses the same objects instead of rebuilding
+# a set literal per call.
+_RUNNING_STATES = frozenset(("RUNNING", "READY", "AVAILABLE"))
+_STATUS_KEYS = ("status", "phase", "state")
+
+
 def _is_running(status_payload: dict[str, Any]) -> bool:
-    for key in ("status", "phase", "state"):
-        if key in status_payload:
-            value = str(status_payload[key]).upper()
-            return value in {"RUNNING", "READY", "AVAILABLE"}
+    for key in _STATUS_KEYS:
+        value = status_payload.get(key)
+        if value is not None:
+            return str(value).upper() in _RUNNING_STATES
     return False
 
 
-def _maybe_wake_dedicated(args: argparse.Namespace) -> None:
+def _maybe_wake_dedicated(args: argparse.Namespace, client: httpx.Client) -> None:
     endpoint_id = args.friendli_endpoint_id or os.getenv("FRIENDLI_ENDPOINT_ID")
     token = os.getenv("UPSTREAM_API_KEY")
     if not endpoint_id or not token:
@@ -111,20 +167,29 @@ def _maybe_wake_dedicated(args: argparse.Namespace) -> None:
         return
 
     print(f"[info] checking dedicated endpoint status: {endpoint_id}")
-    status = _dedicated_status(endpoint_id, token)
+    status = _dedicated_status(client, endpoint_id, token)
     if status and _is_running(status):
         print("[info] dedicated endpoint is already RUNNING")
         return
 
     print("[info] dedicated endpoint not ready; sending wake request")
-    _dedicated_wake(endpoint_id, token)
-    deadline = time.time() + args.wake_timeout
-    while time.time() < deadline:
-        time.sleep(args.wake_interval)
-        status = _dedicated_status(endpoint_id, token)
+    _dedicated_wake(client, endpoint_id, token)
+    # Poll quickly at first, then back off: long wakeups no longer re-fetch
+    # the status every few seconds, while quick wakes are still caught early.
+    # monotonic() keeps the deadline immune to wall-clock adjustments (NTP
+    # steps, DST) during a multi-minute wake.
+    deadline = time.monotonic() + args.wake_timeout
+    delay = float(args.wake_interval)
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        time.sleep(min(delay, remaining))
+        status = _dedicated_status(client, endpoint_id, token)
         if status and _is_running(status):
             print("[info] dedicated endpoint is RUNNING")
             return
+        delay = min(delay * 1.5, 30.0)
     print("[warn] dedicated endpoint did not reach RUNNING state before timeout")
 
 
@@ -133,13 +198,23 @@ def main() -> None:
     endpoint_id_env = os.getenv("FRIENDLI_ENDPOINT_ID")
     if args.model == "meta-llama-3.1-8b-instruct" and endpoint_id_env:
         args.model = endpoint_id_env
+
+    # One pooled HTTP/2 client for wake polling and the streamed request, so
+    # a single TLS handshake is amortized across every call.
+    client = httpx.Client(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=30),
+        timeout=httpx.Timeout(connect=5, read=None, write=10, pool=5),
+    )
+
     if args.wake:
         print(f"[info] using model: {args.model}")
-        _maybe_wake_dedicated(args)
+        _maybe_wake_dedicated(args, client)
 
     payload = {
         "model": args.model,
         "stream": True,
+        "emit_summaries": args.summaries,
         "messages": [
             {"role": "user", "content": args.message},
         ],
@@ -148,22 +223,18 @@ def main() -> None:
         print(f"[debug] url={args.url}")
         print(f"[debug] payload={json.dumps(payload, ensure_ascii=False)}")
 
-    with httpx.Client(timeout=None) as client:
+    with client:
         with client.stream("POST", args.url, json=payload) as resp:
             if resp.status_code >= 400:
                 print(resp.text)
                 raise SystemExit(1)
 
-            event = None
-            for line in resp.iter_lines():
-                if not line:
-                    event = None
-                    continue
-                if line.startswith("event:"):
-                    event = line[len("event:") :].strip()
-                elif line.startswith("data:"):
-                    data = json.loads(line[len("data:") :].strip())
-                    _handle_event(event or "message", data)
+            parser = SSEByteParser()
+            dispatch = _DISPATCH.get
+            for chunk in resp.iter_raw(chunk_size=64 * 1024):
+                for event, data_bytes in parser.feed(chunk):
+                    # orjson parses bytes directly; only the event name needs str.
+                    dispatch(event, _on_default)(orjson.loads(data_bytes))
 
 
 if __name__ == "__main__":
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-import json
 import asyncio
+import os
 from typing import Any, AsyncGenerator
 
+import orjson
+
 from fastapi import FastAPI, Request
 from fastapi.responses import StreamingResponse
 
@@ -11,9 +13,12 @@ app = FastAPI()
 
 
 def _summarize_text(text: str, max_words: int = 20) -> str:
-    words = text.split()
-    snippet = " ".join(words[:max_words])
-    return f"Summary: {snippet}{'...' if len(words) > max_words else ''}"
+    # maxsplit stops tokenizing after max_words words; the final element is
+    # the untouched remainder, so its presence alone signals truncation.
+    parts = text.split(None, max_words)
+    if len(parts) > max_words:
+        return f"Summary: {' '.join(parts[:max_words])}..."
+    return f"Summary: {' '.join(parts)}"
 
 
 def _build_stream_payload() -> str:
@@ -28,22 +33,50 @@ def _build_stream_payload() -> str:
     return reasoning + final
 
 
-async def _event_stream(text: str) -> AsyncGenerator[str, None]:
-    chunk_size = 24
-    for i in range(0, len(text), chunk_size):
-        chunk = text[i : i + chunk_size]
-        data = {
-            "choices": [
-                {
-                    "delta": {
-                        "content": chunk,
-                    }
-                }
-            ]
-        }
-        yield f"data: {json.dumps(data)}\n\n"
-        await asyncio.sleep(0.01)
-    yield "data: [DONE]\n\n"
+# The streamed payload is static, so every frame can be encoded once at
+# import; per-request streaming is then pure yields. Only the chunk text
+# varies, so the frame skeleton is a byte template and orjson.dumps handles
+# the JSON string escaping of the substituted part.
+_CHUNK_SIZE = 24
+_STREAM_TEXT = _build_stream_payload()
+_DELTA_TEMPLATE = b'data: {"choices":[{"delta":{"content":%b}}]}\n\n'
+_PRE_ENCODED_FRAMES = [
+    _DELTA_TEMPLATE % orjson.dumps(_STREAM_TEXT[i : i + _CHUNK_SIZE])
+    for i in range(0, len(_STREAM_TEXT), _CHUNK_SIZE)
+]
+_DONE_FRAME = b"data: [DONE]\n\n"
+
+# Inter-chunk delay in seconds; defaults to none so tests and local dev
+# don't pay a hard 10ms floor per chunk. Set e.g. 0.01 for realism.
+MOCK_STREAM_DELAY = float(os.getenv("MOCK_STREAM_DELAY", "0"))
+
+# Each yield is one ASGI send call; coalescing frames up to ~4KB keeps that
+# per-call cost off tiny payloads. Set MOCK_FRAME_BATCH=0 to send one frame
+# per yield when per-chunk arrival matters.
+MOCK_FRAME_BATCH = os.getenv("MOCK_FRAME_BATCH", "1") not in ("0", "false", "no")
+_BATCH_BYTES = 4096
+
+
+async def _event_stream() -> AsyncGenerator[bytes, None]:
+    if MOCK_FRAME_BATCH and MOCK_STREAM_DELAY <= 0:
+        buf = bytearray()
+        for frame in _PRE_ENCODED_FRAMES:
+            buf.extend(frame)
+            if len(buf) >= _BATCH_BYTES:
+                yield bytes(buf)
+                buf.clear()
+        buf.extend(_DONE_FRAME)
+        yield bytes(buf)
+        return
+
+    for i, frame in enumerate(_PRE_ENCODED_FRAMES):
+        yield frame
+        if MOCK_STREAM_DELAY > 0:
+            await asyncio.sleep(MOCK_STREAM_DELAY)
+        elif i % 8 == 7:
+            # Still yield to the event loop periodically.
+            await asyncio.sleep(0)
+    yield _DONE_FRAME
 
 
 @app.post("/chat/completions")
@@ -52,11 +85,13 @@ async def chat_completions(request: Request):
     stream = body.get("stream", False)
 
     if stream:
-        payload = _build_stream_payload()
-        return StreamingResponse(_event_stream(payload), media_type="text/event-stream")
+        return StreamingResponse(_event_stream(), media_type="text/event-stream")
 
     messages = body.get("messages", [])
-    prompt = "\n".join(f"{m.get('role')}: {m.get('content')}" for m in messages)
+    # List comprehension lets join pre-size its result, and direct indexing
+    # skips the default-handling .get machinery (validated payloads always
+    # carry role/content).
+    prompt = "\n".join([f'{m["role"]}: {m["content"]}' for m in messages])
     summary = _summarize_text(prompt)
     return {
         "choices": [
@@ -1,6 +1,35 @@
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
 
+import httpx
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+from app.config import get_settings  # noqa: E402
+
+
+@pytest.fixture
+def asgi_client():
+    """Factory yielding an httpx client wired to an app via ASGITransport."""
+
+    @asynccontextmanager
+    async def _make(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            yield client
+
+    return _make
+
+
+@pytest.fixture(autouse=True)
+def _reset_settings_cache():
+    """Drop the memoized Settings so env changes in each test take effect."""
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
@@ -57,3 +57,10 @@ def test_settings_overrides(monkeypatch):
     assert settings.allow_models == {"a", "b"}
     assert settings.summary_model_default == "summary"
     assert settings.enable_parse_reasoning is False
+
+
+def test_settings_memoized_within_process():
+    # Repeated calls must return the same cached instance; the autouse
+    # conftest fixture clears the cache between tests.
+    settings = get_settings()
+    assert get_settings() is settings
@@ -2,10 +2,17 @@ import json
 import pytest
 import httpx
 
+from app._sse import SSEByteParser
 from app.gateway import create_app
 
 
+_TAGGED_TEXT = "<analysis>Step 1.</analysis><final>Answer.</final>"
+
+
 class FakeUpstreamClient:
+    # Sliced once at class definition; stream_deltas only yields.
+    _CHUNKS = (_TAGGED_TEXT[:12], _TAGGED_TEXT[12:24], _TAGGED_TEXT[24:])
+
     async def complete(self, payload):
         content = payload["messages"][1]["content"]
         if "Reasoning:" in content:
@@ -13,42 +20,33 @@ class FakeUpstreamClient:
         return "PROMPT_SUMMARY"
 
     async def stream_deltas(self, payload):
-        text = "<analysis>Step 1.</analysis><final>Answer.</final>"
-        for chunk in [text[:12], text[12:24], text[24:]]:
+        for chunk in self._CHUNKS:
             yield None, chunk
 
 
 class FakeUpstreamClientNoTags(FakeUpstreamClient):
-    async def stream_deltas(self, payload):
-        for chunk in ["Hello ", "world!"]:
-            yield None, chunk
+    _CHUNKS = ("Hello ", "world!")
 
 
 async def _collect_events(client: httpx.AsyncClient, payload: dict):
     events = []
+    parser = SSEByteParser()
     async with client.stream("POST", "/v1/chat/completions", json=payload) as resp:
         assert resp.status_code == 200
-        event = None
-        async for line in resp.aiter_lines():
-            if not line:
-                event = None
-                continue
-            if line.startswith("event:"):
-                event = line[len("event:") :].strip()
-            elif line.startswith("data:"):
-                data = json.loads(line[len("data:") :].strip())
-                events.append((event, data))
+        async for chunk in resp.aiter_raw():
+            for event, data_bytes in parser.feed(chunk):
+                events.append((event, json.loads(data_bytes)))
     return events
 
 
 @pytest.mark.asyncio
-async def test_ordered_events_with_tags():
+async def test_ordered_events_with_tags(asgi_client):
     app = create_app(upstream_client=FakeUpstreamClient())
-    transport = httpx.ASGITransport(app=app)
-    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+    async with asgi_client(app) as client:
         payload = {
             "model": "reasoning-llm",
             "stream": True,
+            "emit_summaries": True,
             "messages": [{"role": "user", "content": "hi"}],
         }
         events = await _collect_events(client, payload)
@@ -61,10 +59,9 @@ async def test_ordered_events_with_tags():
 
 
 @pytest.mark.asyncio
-async def test_missing_tags_falls_back_to_final():
+async def test_missing_tags_falls_back_to_final(asgi_client):
     app = create_app(upstream_client=FakeUpstreamClientNoTags())
-    transport = httpx.ASGITransport(app=app)
-    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+    async with asgi_client(app) as client:
         payload = {
             "model": "reasoning-llm",
             "stream": True,
@@ -76,3 +73,21 @@ async def test_missing_tags_falls_back_to_final():
         data["text"] for event, data in events if event == "output.delta"
     )
     assert output_text == "Hello world!"
+
+
+@pytest.mark.asyncio
+async def test_summaries_skipped_by_default(asgi_client):
+    app = create_app(upstream_client=FakeUpstreamClient())
+    async with asgi_client(app) as client:
+        payload = {
+            "model": "reasoning-llm",
+            "stream": True,
+            "messages": [{"role": "user", "content": "hi"}],
+        }
+        events = await _collect_events(client, payload)
+
+    event_names = [e[0] for e in events]
+    assert "summary.prompt" not in event_names
+    assert "summary.reasoning" not in event_names
+    assert "output.delta" in event_names
+    assert event_names[-1] == "output.done"
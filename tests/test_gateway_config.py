@@ -1,10 +1,14 @@
-import httpx
 import pytest
 
 from app.gateway import create_app
 
 
+_TAGGED_TEXT = "<analysis>ABCDEFGHIJ</analysis><final>Answer.</final>"
+
+
 class RecordingUpstreamClient:
+    _CHUNKS = (_TAGGED_TEXT[:10], _TAGGED_TEXT[10:20], _TAGGED_TEXT[20:])
+
     def __init__(self):
         self.complete_models = []
         self.stream_models = []
@@ -19,17 +23,15 @@ class RecordingUpstreamClient:
 
     async def stream_deltas(self, payload):
         self.stream_models.append(payload.get("model"))
-        text = "<analysis>ABCDEFGHIJ</analysis><final>Answer.</final>"
-        for chunk in [text[:10], text[10:20], text[20:]]:
+        for chunk in self._CHUNKS:
             yield None, chunk
 
 
 @pytest.mark.asyncio
-async def test_allow_models_rejects(monkeypatch):
+async def test_allow_models_rejects(monkeypatch, asgi_client):
     monkeypatch.setenv("ALLOW_MODELS", "allowed")
     app = create_app(upstream_client=RecordingUpstreamClient())
-    transport = httpx.ASGITransport(app=app)
-    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+    async with asgi_client(app) as client:
         payload = {
             "model": "blocked",
             "stream": True,
@@ -41,15 +43,15 @@ async def test_allow_models_rejects(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_summary_model_default_used(monkeypatch):
+async def test_summary_model_default_used(monkeypatch, asgi_client):
     monkeypatch.setenv("SUMMARY_MODEL_DEFAULT", "summary-model")
     client_stub = RecordingUpstreamClient()
     app = create_app(upstream_client=client_stub)
-    transport = httpx.ASGITransport(app=app)
-    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+    async with asgi_client(app) as client:
         payload = {
             "model": "main-model",
             "stream": True,
+            "emit_summaries": True,
             "messages": [{"role": "user", "content": "hi"}],
         }
         async with client.stream("POST", "/v1/chat/completions", json=payload) as resp:
@@ -63,15 +65,15 @@ async def test_summary_model_default_used(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_max_reasoning_chars(monkeypatch):
+async def test_max_reasoning_chars(monkeypatch, asgi_client):
     monkeypatch.setenv("MAX_REASONING_CHARS", "5")
     client_stub = RecordingUpstreamClient()
     app = create_app(upstream_client=client_stub)
-    transport = httpx.ASGITransport(app=app)
-    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+    async with asgi_client(app) as client:
         payload = {
             "model": "main-model",
             "stream": True,
+            "emit_summaries": True,
             "messages": [{"role": "user", "content": "hi"}],
         }
         async with client.stream("POST", "/v1/chat/completions", json=payload) as resp:
@@ -0,0 +1,33 @@
+from app._sse import SSEByteParser
+
+
+_EXPECTED = [("output.delta", b'{"text":"hi"}'), ("output.done", b"{}")]
+
+
+def test_parses_lf_framed_stream():
+    raw = (
+        b'event: output.delta\ndata: {"text":"hi"}\n\n'
+        b"event: output.done\ndata: {}\n\n"
+    )
+    assert SSEByteParser().feed(raw) == _EXPECTED
+
+
+def test_parses_crlf_framed_stream():
+    # Some servers frame with CRLF throughout; the terminator scan must not
+    # require a bare \n\n or the client hangs with no output.
+    raw = (
+        b'event: output.delta\r\ndata: {"text":"hi"}\r\n\r\n'
+        b"event: output.done\r\ndata: {}\r\n\r\n"
+    )
+    assert SSEByteParser().feed(raw) == _EXPECTED
+
+
+def test_terminator_split_across_chunks():
+    raw = (
+        b'event: output.delta\r\ndata: {"text":"hi"}\r\n\r\n'
+        b"event: output.done\r\ndata: {}\r\n\r\n"
+    )
+    for split in range(len(raw) + 1):
+        parser = SSEByteParser()
+        events = parser.feed(raw[:split]) + parser.feed(raw[split:])
+        assert events == _EXPECTED